@@ -1,13 +1,19 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
-import ics
-from ics import Calendar, Event
+import soupsieve as sv
 import datetime
 import time
 import os
+import atexit
+import functools
+import hashlib
+import json
 import re
 import logging
 from zoneinfo import ZoneInfo
+from dataclasses import dataclass
 
 # Configure logging
 logging.basicConfig(
@@ -16,9 +22,20 @@ logging.basicConfig(
     handlers=[logging.FileHandler("penn_state_football_scraper.log"), logging.StreamHandler()]
 )
 logger = logging.getLogger(__name__)
+# Connection-pool chatter from urllib3 is noise in the run log.
+logging.getLogger("urllib3").setLevel(logging.WARNING)
 
 CALENDAR_FILE = "penn_state_football.ics"
 
+# Validators (ETag / Last-Modified / body hash) of the source the current
+# calendar was built from, so an unchanged source skips the whole scrape.
+# The workflow keeps .cache/ between runs with actions/cache.
+HTTP_CACHE_FILE = os.path.join(".cache", "psu_sched.json")
+# Digest of this script: any parser or serializer change invalidates the cache,
+# so an unchanged source is still re-scraped and re-serialized once.
+with open(__file__, 'rb') as _script:
+    HTTP_CACHE_VERSION = hashlib.blake2b(_script.read(), digest_size=8).hexdigest()
+
 # ESPN's team id for the Penn State Nittany Lions
 ESPN_TEAM_ID = "213"
 
@@ -34,9 +51,39 @@ except ImportError:  # pragma: no cover - depends on install environment
 
 IMPERSONATE_PROFILES = ("chrome", "safari")
 
+# lxml builds the tree in C, several times faster than the pure-Python
+# html.parser, which stays as the fallback when lxml is not installed.
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:  # pragma: no cover - depends on install environment
+    HTML_PARSER = "html.parser"
+
 # Statuses worth retrying: bot walls and rate limits are usually transient.
 RETRY_STATUSES = (403, 429, 500, 502, 503, 504)
 
+# One pooled session per transport, so the endpoints a run walks through
+# (several ESPN hosts, then gopsusports) reuse keep-alive connections instead
+# of paying a TCP + TLS handshake per request.  Status retries stay in
+# http_get, which also rotates transports; the adapter only retries failed
+# connects.
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=10,
+    max_retries=Retry(total=2, connect=2, read=0, status=0, backoff_factor=0.3),
+))
+atexit.register(SESSION.close)
+
+CURL_SESSIONS = {}
+if curl_requests is not None:
+    CURL_SESSIONS = {p: curl_requests.Session(impersonate=p) for p in IMPERSONATE_PROFILES}
+    for _curl_session in CURL_SESSIONS.values():
+        atexit.register(_curl_session.close)
+
+# Validators of every URL fetched this run with HTTP 200, keyed by URL.
+RESPONSE_VALIDATORS = {}
+
 
 def get_browser_headers(accept_json=False):
     """Full Chrome header set - a truncated User-Agent alone reads as a bot."""
@@ -93,11 +140,11 @@ def http_get(url, headers=None, timeout=30, retries=3, accept_json=False):
         for label, profile in attempts:
             try:
                 if profile is not None:
-                    response = curl_requests.get(
+                    response = CURL_SESSIONS[profile].get(
                         url, headers=request_headers, timeout=timeout, impersonate=profile
                     )
                 else:
-                    response = requests.get(url, headers=request_headers, timeout=timeout)
+                    response = SESSION.get(url, headers=request_headers, timeout=timeout)
             except Exception as e:
                 logger.warning(f"{label} request to {url} raised: {e}")
                 continue
@@ -105,6 +152,13 @@ def http_get(url, headers=None, timeout=30, retries=3, accept_json=False):
             if response.status_code not in RETRY_STATUSES:
                 if round_index or label != "requests":
                     logger.info(f"{label} fetched {url} -> HTTP {response.status_code}")
+                if response.status_code == 200:
+                    RESPONSE_VALIDATORS[url] = {
+                        'etag': response.headers.get('ETag', ''),
+                        'last_modified': response.headers.get('Last-Modified', ''),
+                        'sha256': hashlib.sha256(response.content).hexdigest(),
+                        'accept_json': accept_json,
+                    }
                 return response
 
             logger.warning(f"{label} got HTTP {response.status_code} from {url}")
@@ -118,6 +172,97 @@ def http_get(url, headers=None, timeout=30, retries=3, accept_json=False):
     return last_response
 
 
+_UTF8_CHARSET_RE = re.compile(r'charset=["\']?utf-?8\b', re.I)
+
+
+def declared_encoding(response):
+    """
+    'utf-8' when the Content-Type header declares it, so BeautifulSoup can skip
+    encoding detection; otherwise None and the parser sniffs as before.  Other
+    labels are not passed through: a wrong single-byte charset makes lxml drop
+    text, while bad bytes under utf-8 only become U+FFFD.
+    """
+    if _UTF8_CHARSET_RE.search(response.headers.get('Content-Type', '')):
+        return 'utf-8'
+    return None
+
+
+def load_http_cache():
+    """Validators saved by the last successful update, or {} if there are none."""
+    try:
+        with open(HTTP_CACHE_FILE) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_http_cache(cache):
+    os.makedirs(os.path.dirname(HTTP_CACHE_FILE), exist_ok=True)
+    with open(HTTP_CACHE_FILE, 'w') as f:
+        json.dump(cache, f, indent=2)
+
+
+def clear_http_cache():
+    """Forget the saved source; called whenever a calendar is written that did not come from it."""
+    try:
+        os.remove(HTTP_CACHE_FILE)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.warning(f"Could not remove HTTP cache: {e}")
+
+
+def calendar_matches_cache(cache):
+    """True if CALENDAR_FILE is still exactly the calendar the cache was saved for."""
+    if cache.get('version') != HTTP_CACHE_VERSION or not cache.get('calendar_digest'):
+        return False
+    try:
+        with open(CALENDAR_FILE, 'rb') as f:
+            return _calendar_digest(f.read()).hex() == cache['calendar_digest']
+    except OSError:
+        return False
+
+
+def source_unchanged(cache):
+    """
+    Conditional GET against the URL the current calendar was built from.
+    True on HTTP 304, or on a 200 whose body hashes the same as last time
+    (for hosts that ignore If-None-Match / If-Modified-Since).
+    """
+    url = cache.get('url')
+    if not url:
+        return False
+
+    headers = {}
+    if cache.get('etag'):
+        headers['If-None-Match'] = cache['etag']
+    if cache.get('last_modified'):
+        headers['If-Modified-Since'] = cache['last_modified']
+
+    response = http_get(url, headers=headers, timeout=30, retries=1,
+                        accept_json=cache.get('accept_json', False))
+    if response is None:
+        return False
+    if response.status_code == 304:
+        return True
+    return response.status_code == 200 and hashlib.sha256(response.content).hexdigest() == cache.get('sha256')
+
+
+@dataclass(slots=True)
+class Game:
+    """One scraped game; start/end are timezone-aware Eastern datetimes."""
+    title: str
+    start: datetime.datetime
+    end: datetime.datetime
+    location: str
+    broadcast: str
+    is_home: bool
+    opponent: str
+    date_str: str
+    time_str: str
+    source_url: str = ""
+
+
 # Expected number of games per season for validation
 EXPECTED_GAMES_PER_SEASON = {
     2026: 12,
@@ -130,6 +275,12 @@ EXPECTED_GAMES_PER_SEASON = {
 # Minimum acceptable number of games (fallback for unknown years)
 MIN_GAMES_THRESHOLD = 10
 
+# Calendar block for each game: kickoff plus a typical broadcast window.
+GAME_DURATION = datetime.timedelta(hours=3, minutes=30)
+
+# All kickoffs are stored in Eastern time; ZoneInfo handles the DST transitions.
+EASTERN_TZ = ZoneInfo("America/New_York")
+
 def get_current_season():
     """Get the current football season based on the current date"""
     today = datetime.datetime.now()
@@ -155,231 +306,244 @@ def get_sidearm_headers():
         'Referer': 'https://www.google.com/',
     }
 
+def _scan_clock(time_str):
+    """
+    Single pass over a kickoff like "3:30 PM" or "8 p.m.": digits accumulate
+    straight into hour/minute with no intermediate strings.  Returns a 24-hour
+    (hour, minute), or None when the text is not a plain clock so the caller
+    can fall back to the general parser.
+    """
+    hour = minute = digits = 0
+    in_minutes = False
+    meridiem = ''
+    for i, c in enumerate(time_str):
+        if '0' <= c <= '9':
+            if in_minutes:
+                minute = minute * 10 + (ord(c) - 48)
+            else:
+                hour = hour * 10 + (ord(c) - 48)
+            digits += 1
+        elif c == ':' and digits and not in_minutes:
+            in_minutes = True
+        elif c in 'AaPp':
+            # Only "PM" / "p.m." is a meridiem; "7 at" or "10:30 PT" is other
+            # text, left to the general parser.
+            rest = time_str[i + 1:i + 3]
+            if not (rest[:1] in ('M', 'm') or (rest[:1] == '.' and rest[1:2] in ('M', 'm'))):
+                return None
+            meridiem = c.upper()
+            break
+        elif c != ' ':
+            return None
+    if not digits:
+        return None
+
+    if meridiem == 'P' and hour < 12:
+        hour += 12
+    elif meridiem == 'A' and hour == 12:
+        hour = 0
+    elif not meridiem and hour < 8:
+        # No AM/PM on a small hour: college kickoffs are afternoon/evening
+        hour += 12
+    if hour > 23 or minute > 59:
+        return None
+    return hour, minute
+
+
+def _iso_eastern(value):
+    """
+    Read an ISO timestamp in Eastern time (naive values are taken as Eastern).
+    Returns (kickoff, is_placeholder): midnight UTC - how ESPN writes a kickoff
+    that is not set yet - or midnight Eastern carries only a date.
+    Raises ValueError / OverflowError like fromisoformat / astimezone.
+    """
+    raw = datetime.datetime.fromisoformat(value.replace('Z', '+00:00'))
+    if raw.tzinfo is None:
+        kickoff = raw.replace(tzinfo=EASTERN_TZ)
+    else:
+        kickoff = raw.astimezone(EASTERN_TZ)
+    utc_midnight = raw.utcoffset() == datetime.timedelta(0) and not (raw.hour or raw.minute)
+    return kickoff, utc_midnight or not (kickoff.hour or kickoff.minute)
+
+
 def parse_date_time(date_str, time_str="", year=None):
     """
     STRICT date/time parsing - returns None if parsing fails
     Uses 1pm ET default for games without specified times
     """
-    try:
-        if year is None:
-            year = get_current_season()
-
-        # The caller passes a *season*, not a calendar year; only a date string
-        # that carries its own year overrides it.
-        season_year = year
-        year_is_explicit = False
-
-        # Clean inputs
-        date_str = date_str.strip() if date_str else ""
-        time_str = time_str.strip() if time_str else ""
-
-        # AP-style month abbreviations ("Sept. 5", "Aug. 29") - drop the period
-        # so the word-and-number branches below match.
-        date_str = re.sub(rf'({_MONTH_PATTERN})\.', r'\1', date_str, flags=re.I)
-
-        # gopsusports.com SIDEARM sometimes omits space: "SaturdayApr 25"
-        date_str = re.sub(
-            r"(?i)(Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday)"
-            r"(January|February|March|April|May|June|July|August|September|October|November|December|"
-            r"Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\b",
-            r"\1 \2",
-            date_str,
-        )
-        
-        # STRICT REQUIREMENT: Must have actual date string
-        if not date_str or date_str.upper() in ["TBA", "TBD", "TIME TBA", ""]:
-            logger.warning(f"No valid date string provided: '{date_str}'")
+    if year is None:
+        year = get_current_season()
+    # Resolve the season here so the memoized parser's key is just its inputs.
+    return _parse_date_time_cached(date_str or "", time_str or "", year)
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_date_time_cached(date_str, time_str, year):
+    """parse_date_time for an explicit season; failures (None) are cached too."""
+    # The caller passes a *season*, not a calendar year; only a date string
+    # that carries its own year overrides it.
+    season_year = year
+    year_is_explicit = False
+
+    # Clean inputs
+    date_str = date_str.strip() if date_str else ""
+    time_str = time_str.strip() if time_str else ""
+
+    # ISO kickoff from a <time datetime="2026-09-05T19:30:00Z"> attribute:
+    # fromisoformat reads it whole.  A placeholder (see _iso_eastern) keeps
+    # only its Eastern date and lets time_str (or the 1pm default) supply the
+    # clock, as scrape_espn_api does for timeValid=False.
+    if _ISO_DATETIME_RE.match(date_str):
+        try:
+            kickoff, is_placeholder = _iso_eastern(date_str)
+        except ValueError:
+            kickoff = None
+        except OverflowError:
+            # e.g. '9999-12-31T23:59-12:00' - Eastern time would leave datetime's range
+            logger.error("ISO datetime out of range: %s", date_str)
             return None
-        
-        logger.debug(f"Parsing date: '{date_str}', time: '{time_str}', year: {year}")
-        
-        # Handle various date formats
-        month, day = None, None
-        
-        if "/" in date_str and re.match(r"^\s*\d{1,2}\s*/\s*\d{1,2}", date_str):
-            # Format: MM/DD or MM/DD/YY (avoid "MST) / 2:00 PM (EST)" style SIDEARM strings)
-            parts = [p.strip() for p in date_str.split("/")]
-            if len(parts) >= 2:
-                try:
-                    month = int(parts[0])
-                    day = int(parts[1])
-                    if len(parts) >= 3 and len(parts[2]) >= 2:
-                        year_part = int(parts[2])
-                        if year_part > 50:
-                            year = 1900 + year_part
-                        else:
-                            year = 2000 + year_part
-                        year_is_explicit = True
-                except ValueError:
-                    logger.error(f"Could not parse numeric date parts: {parts}")
-                    return None
-        elif re.match(r'\w+,?\s+\w+\s+\d+', date_str):
-            # Handle ESPN format: "Sat, Aug 30" or "Saturday, August 30"
-            try:
-                from dateutil import parser
-                # Remove day of week and parse the rest
-                date_without_day = re.sub(r'^\w+,?\s+', '', date_str)
-                parsed = parser.parse(f"{date_without_day} {year}")
-                month, day = parsed.month, parsed.day
-                logger.debug(f"ESPN date format parsed: '{date_str}' -> month={month}, day={day}")
-            except Exception as e:
-                logger.error(f"Could not parse ESPN date format '{date_str}': {e}")
-                return None
-        elif re.match(r'\w+\s+\d+', date_str):
-            # Handle "Sep 20", "September 20" format
-            try:
-                from dateutil import parser
-                parsed = parser.parse(f"{date_str} {year}")
-                month, day = parsed.month, parsed.day
-            except:
-                # Fallback manual parsing
-                month_names = {
-                    'Jan': 1, 'January': 1, 'Feb': 2, 'February': 2, 'Mar': 3, 'March': 3,
-                    'Apr': 4, 'April': 4, 'May': 5, 'Jun': 6, 'June': 6,
-                    'Jul': 7, 'July': 7, 'Aug': 8, 'August': 8, 'Sep': 9, 'September': 9,
-                    'Oct': 10, 'October': 10, 'Nov': 11, 'November': 11, 'Dec': 12, 'December': 12
-                }
-                parts = date_str.split()
-                if len(parts) >= 2:
-                    month_str = parts[0]
-                    # Try exact match first, then partial match
-                    month = month_names.get(month_str)
-                    if not month:
-                        for key, val in month_names.items():
-                            if month_str.lower().startswith(key.lower()[:3]):
-                                month = val
-                                break
-                    
-                    try:
-                        day = int(parts[1])
-                    except ValueError:
-                        logger.error(f"Could not parse day from: {parts[1]}")
-                        return None
-                else:
-                    logger.error(f"Insufficient date parts: {parts}")
-                    return None
-        elif re.match(r'\d{1,2}/\d{1,2}', date_str):
-            # Handle MM/DD format
-            parts = date_str.split('/')
+        if kickoff is None:
+            date_str = date_str[:10]
+        elif not is_placeholder:
+            return kickoff
+        else:
+            date_str = kickoff.date().isoformat()
+
+    # AP-style month abbreviations ("Sept. 5", "Aug. 29") - drop the period
+    # so the word-and-number branches below match.
+    date_str = _AP_MONTH_RE.sub(r'\1', date_str)
+
+    # gopsusports.com SIDEARM sometimes omits space: "SaturdayApr 25"
+    date_str = _WEEKDAY_JOINED_MONTH_RE.sub(r"\1 \2", date_str)
+    
+    # STRICT REQUIREMENT: Must have actual date string
+    if not date_str or date_str.upper() in _PLACEHOLDER_TEXT:
+        logger.warning("No valid date string provided: '%s'", date_str)
+        return None
+    
+    logger.debug("Parsing date: '%s', time: '%s', year: %s", date_str, time_str, year)
+    
+    # Handle various date formats
+    month, day = None, None
+    
+    if "/" in date_str and _NUMERIC_DATE_PREFIX_RE.match(date_str):
+        # Format: MM/DD or MM/DD/YY (avoid "MST) / 2:00 PM (EST)" style SIDEARM strings)
+        parts = [p.strip() for p in date_str.split("/")]
+        if len(parts) >= 2:
             try:
                 month = int(parts[0])
                 day = int(parts[1])
+                if len(parts) >= 3 and len(parts[2]) >= 2:
+                    year_part = int(parts[2])
+                    if year_part > 50:
+                        year = 1900 + year_part
+                    else:
+                        year = 2000 + year_part
+                    year_is_explicit = True
             except ValueError:
-                logger.error(f"Could not parse MM/DD format: {date_str}")
+                logger.error("Could not parse numeric date parts: %s", parts)
                 return None
-        elif re.match(r'\d{4}-\d{2}-\d{2}', date_str):
-            # Handle YYYY-MM-DD format
-            parts = date_str.split('-')
-            try:
-                year = int(parts[0])
+    elif _WEEKDAY_MONTH_DAY_RE.match(date_str) or _WORD_NUMBER_RE.match(date_str):
+        # "Sep 20", "September 20", or ESPN's "Sat, Aug 30" / "Saturday, August 30"
+        m = _MONTH_DAY_RE.search(date_str)
+        if m:
+            month = _MONTH_NUMBERS[m.group(1).lower()]
+            day = int(m.group(2))
+            if m.group(3):
+                year = int(m.group(3))
                 year_is_explicit = True
-                month = int(parts[1])
-                day = int(parts[2])
-            except ValueError:
-                logger.error(f"Could not parse YYYY-MM-DD format: {date_str}")
+        else:
+            # Unusual word order ("Saturday 30 August") - let dateutil sort it out
+            try:
+                from dateutil import parser
+                parsed = parser.parse(f"{date_str} {year}")
+                month, day = parsed.month, parsed.day
+            except (ValueError, OverflowError) as e:
+                logger.error("Could not parse date '%s': %s", date_str, e)
                 return None
-        
-        # STRICT REQUIREMENT: Must successfully parse month and day
-        if month is None or day is None:
-            logger.error(f"Failed to parse date: {date_str} - month={month}, day={day}")
+    elif _ISO_DATE_RE.match(date_str):
+        # Handle YYYY-MM-DD format
+        parts = date_str.split('-')
+        try:
+            year = int(parts[0])
+            year_is_explicit = True
+            month = int(parts[1])
+            day = int(parts[2])
+        except ValueError:
+            logger.error("Could not parse YYYY-MM-DD format: %s", date_str)
             return None
+    
+    # STRICT REQUIREMENT: Must successfully parse month and day
+    if month is None or day is None:
+        logger.error("Failed to parse date: %s - month=%s, day=%s", date_str, month, day)
+        return None
 
-        # Schedule pages print "Jan. 1" with no year because the season straddles
-        # New Year: Aug-Dec belong to the season year, Jan-Jul (bowls, CFP) to the
-        # calendar year after it.
-        if not year_is_explicit and month <= 7:
-            year = season_year + 1
-            logger.debug(f"Month {month} rolls into the next calendar year: {year}")
+    # Schedule pages print "Jan. 1" with no year because the season straddles
+    # New Year: Aug-Dec belong to the season year, Jan-Jul (bowls, CFP) to the
+    # calendar year after it.
+    if not year_is_explicit and month <= 7:
+        year = season_year + 1
+        logger.debug("Month %s rolls into the next calendar year: %s", month, year)
 
-        # Parse time - default to 1pm ET if no time provided
-        hour, minute = 13, 0  # Default to 1pm ET for college football
-        
-        # SIDEARM sometimes puts a bare day-of-month in a "time" slot (e.g. "26" from Sep 26)
-        if time_str and re.fullmatch(r"\d{1,2}", time_str.strip()):
-            n = int(time_str.strip())
-            if 1 <= n <= 31:
-                logger.debug(f"Ignoring time_str that looks like day-of-month: '{time_str}'")
-                time_str = ""
-        
-        # Or the "time" cell duplicates the date line (e.g. "SaturdayApr 25") with no clock
-        time_str = re.sub(
-            r"(?i)(Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday)"
-            r"(January|February|March|April|May|June|July|August|September|October|November|December|"
-            r"Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\b",
-            r"\1 \2",
-            time_str,
-        )
-        if time_str and re.search(
-            r"(?i)(Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday)\s+"
-            r"(January|February|March|April|May|June|July|August|September|October|November|December|"
-            r"Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)",
-            time_str,
-        ) and not re.search(r"\d{1,2}\s*[AP]M", time_str, re.I):
-            logger.debug(f"Ignoring time_str that is date text, not a time: '{time_str}'")
+    # Parse time - default to 1pm ET if no time provided
+    hour, minute = 13, 0  # Default to 1pm ET for college football
+    
+    # SIDEARM sometimes puts a bare day-of-month in a "time" slot (e.g. "26" from Sep 26)
+    if time_str and _BARE_NUMBER_RE.fullmatch(time_str):
+        n = int(time_str)
+        if 1 <= n <= 31:
+            logger.debug("Ignoring time_str that looks like day-of-month: '%s'", time_str)
             time_str = ""
+    
+    # Or the "time" cell duplicates the date line (e.g. "SaturdayApr 25") with no clock
+    time_str = _WEEKDAY_JOINED_MONTH_RE.sub(r"\1 \2", time_str)
+    if time_str and _WEEKDAY_MONTH_RE.search(time_str) and not _CLOCK_HINT_RE.search(time_str):
+        logger.debug("Ignoring time_str that is date text, not a time: '%s'", time_str)
+        time_str = ""
+    
+    clock = _scan_clock(time_str) if time_str else None
+    if clock is not None:
+        hour, minute = clock
+    elif time_str and (m := _LOOSE_CLOCK_RE.search(time_str)):
+        # Clock inside other text ("Kickoff 3:30 PM", "3:30 ET"): hour, minute
+        # and meridiem come straight out of the match groups.
+        hour = int(m.group(1))
+        minute = int(m.group(2) or 0)
+        meridiem = (m.group(3) or '').upper()
+        if meridiem == 'P' and hour < 12:
+            hour += 12
+        elif meridiem == 'A' and hour == 12:
+            hour = 0
+        elif not meridiem and hour < 8:
+            # If no AM/PM specified and hour is small, assume PM for college games
+            hour += 12
+    else:
+        logger.debug("No valid time found for %s, using 1pm ET default", date_str)
+    
+    if hour > 23 or hour < 0 or minute > 59 or minute < 0:
+        logger.warning(
+            "Invalid clock from time '%s' (hour=%s, minute=%s), using 1pm ET default", time_str, hour, minute
+        )
+        hour, minute = 13, 0
+    
+    # Validate the date
+    try:
+        # Create timezone-aware datetime in Eastern Time
+        result = datetime.datetime(year, month, day, hour, minute, tzinfo=EASTERN_TZ)
         
-        if time_str and time_str.upper() not in ["TBA", "TBD", "", "TIME TBA"]:
-            is_pm = "PM" in time_str.upper()
-            is_am = "AM" in time_str.upper()
-            
-            # Extract just the time part
-            time_clean = re.sub(r'[^\d:]', '', time_str)
-            
-            if ":" in time_clean:
-                time_parts = time_clean.split(":")
-                try:
-                    hour = int(time_parts[0])
-                    minute = int(time_parts[1]) if len(time_parts) > 1 else 0
-                except ValueError:
-                    logger.warning(f"Could not parse time parts: {time_parts}, using 1pm ET default")
-                    hour, minute = 13, 0
-            elif time_clean.isdigit() and len(time_clean) <= 2:
-                try:
-                    hour = int(time_clean)
-                    minute = 0
-                except ValueError:
-                    hour = 13  # Default to 1pm
-            
-            # Handle AM/PM conversion
-            if is_pm and hour < 12:
-                hour += 12
-            elif is_am and hour == 12:
-                hour = 0
-            elif not is_am and not is_pm and hour < 8:
-                # If no AM/PM specified and hour is small, assume PM for college games
-                hour += 12
-        else:
-            logger.debug(f"No valid time found for {date_str}, using 1pm ET default")
-        
-        if hour > 23 or hour < 0 or minute > 59 or minute < 0:
-            logger.warning(
-                f"Invalid clock from time '{time_str}' (hour={hour}, minute={minute}), using 1pm ET default"
-            )
-            hour, minute = 13, 0
+        # Additional validation: check if date is reasonable for football season
+        # (Jan-Feb is normal - bowls and the playoff run past New Year.)
+        if 3 <= result.month <= 7:
+            logger.warning("Date outside typical football season: %s", result)
+            # Still allow it, but log warning
         
-        # Validate the date
-        try:
-            # Create timezone-aware datetime in Eastern Time
-            # ZoneInfo automatically handles DST transitions
-            eastern_tz = ZoneInfo("America/New_York")
-            result = datetime.datetime(year, month, day, hour, minute, tzinfo=eastern_tz)
-            
-            # Additional validation: check if date is reasonable for football season
-            # (Jan-Feb is normal - bowls and the playoff run past New Year.)
-            if 3 <= result.month <= 7:
-                logger.warning(f"Date outside typical football season: {result}")
-                # Still allow it, but log warning
-            
-            logger.debug(f"Successfully parsed as Eastern Time: {result}")
-            return result
-        except ValueError as e:
-            logger.error(f"Invalid date/time values: year={year}, month={month}, day={day}, hour={hour}, minute={minute} - {e}")
-            return None
-    
-    except Exception as e:
-        logger.error(f"Error parsing date/time: {date_str}, {time_str} - {str(e)}")
+        logger.debug("Successfully parsed as Eastern Time: %s", result)
+        return result
+    except (ValueError, OverflowError) as e:
+        logger.error("Invalid date/time values: year=%s, month=%s, day=%s, hour=%s, minute=%s - %s", year, month, day, hour, minute, e)
         return None
 
+
 def validate_schedule(games, season):
     """
     STRICT validation - calendar will be empty if this fails
@@ -397,18 +561,18 @@ def validate_schedule(games, season):
     
     # Validate that each game has required fields
     for i, game in enumerate(games):
-        if not game.get('opponent'):
+        if not game.opponent:
             logger.error(f"Game {i+1} missing opponent: {game}")
             return False
-        if not game.get('start'):
+        if not game.start:
             logger.error(f"Game {i+1} missing start time: {game}")
             return False
-        if not game.get('title'):
+        if not game.title:
             logger.error(f"Game {i+1} missing title: {game}")
             return False
     
     # Check for suspicious dates (all games on same date, etc.)
-    dates = [game['start'].date() for game in games]
+    dates = [game.start.date() for game in games]
     unique_dates = len(set(dates))
     
     if len(games) > 1 and unique_dates < len(games) * 0.7:  # At least 70% should be on different dates
@@ -440,6 +604,52 @@ _DATE_RE = re.compile(rf'\b({_MONTH_PATTERN}\.?\s+\d{{1,2}})\b', re.I)
 _NUMERIC_DATE_RE = re.compile(r'\b(\d{1,2}/\d{1,2}(?:/\d{2,4})?)\b')
 _TIME_RE = re.compile(r'\b(\d{1,2}:\d{2}\s*[AP]M)\b', re.I)
 
+# parse_date_time runs once per game; compile its patterns once, not per call.
+_PLACEHOLDER_TEXT = frozenset(("TBA", "TBD", "TIME TBA"))
+_WEEKDAY_NAMES = r'(Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday)'
+_MONTH_NAMES = (
+    r'(January|February|March|April|May|June|July|August|September|October|November|December|'
+    r'Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)'
+)
+_AP_MONTH_RE = re.compile(rf'({_MONTH_PATTERN})\.', re.I)
+# gopsusports.com SIDEARM sometimes omits the space: "SaturdayApr 25"
+_WEEKDAY_JOINED_MONTH_RE = re.compile(rf'{_WEEKDAY_NAMES}{_MONTH_NAMES}\b', re.I)
+_WEEKDAY_MONTH_RE = re.compile(rf'{_WEEKDAY_NAMES}\s+{_MONTH_NAMES}', re.I)
+_NUMERIC_DATE_PREFIX_RE = re.compile(r'^\s*\d{1,2}\s*/\s*\d{1,2}')
+_WEEKDAY_MONTH_DAY_RE = re.compile(r'\w+,?\s+\w+\s+\d+')
+_WORD_NUMBER_RE = re.compile(r'\w+\s+\d+')
+# Any spelling that starts with a month's three letters: "Sep", "Sept.", "September",
+# with an optional four-digit year: "Aug 30, 2026".
+_MONTH_DAY_RE = re.compile(
+    r'\b(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?\s+(\d{1,2})\b(?:,?\s+(\d{4})\b)?', re.I | re.A
+)
+_MONTH_NUMBERS = {
+    name: number for number, name in enumerate(
+        ('jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec'), start=1
+    )
+}
+_ISO_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+_ISO_DATETIME_RE = re.compile(r'\d{4}-\d{2}-\d{2}T\d{2}:\d{2}')
+_BARE_NUMBER_RE = re.compile(r'\d{1,2}')
+_CLOCK_HINT_RE = re.compile(r'\d{1,2}\s*[AP]M', re.I)
+_LOOSE_CLOCK_RE = re.compile(r'\b(\d{1,2})(?::(\d{2}))?\s*(?:([AP])\.?\s*M\b)?', re.I)
+
+# Opponent, broadcast and home/away cleanup for the HTML scrapers.
+_LEADING_RANK_RE = re.compile(r'^\s*#?\d+\s*')
+_PAREN_RANK_RE = re.compile(r'\s*\(\d+\)\s*')
+_HASH_RANK_RE = re.compile(r'\s*#\d+\s*')
+_LEADING_NUMBER_RE = re.compile(r'^\d+\s+')
+_OPPONENT_AFTER_VS_RE = re.compile(r'(?:vs\.?\s+|at\s+|@\s+)([A-Z][A-Za-z\s&\-\'\.]{1,40})')
+_OPPONENT_NOISE_RE = re.compile(r'\s{2,}|\n|\d')
+_VS_AT_PREFIX_RE = re.compile(r'^(vs\.?\s*|at\s*|@\s*)', re.I)
+_VS_PREFIX_RE = re.compile(r'^vs\s+', re.I)
+_BROADCAST_LABEL_RE = re.compile(r'^\s*(TV|Watch|Live)\s*:\s*', re.I)
+_HOME_VS_RE = re.compile(r'\bvs\.?\s', re.I)
+_AWAY_AT_RE = re.compile(r'\bat\s+[A-Z]')
+_ESPN_CLOCK_RE = re.compile(r'\d+:\d+\s*[AP]M', re.I)
+# Bye weeks and unassigned slots in ESPN's opponent column (substring match).
+_ESPN_NON_GAME_RE = re.compile(r'bye|open|tbd|tba', re.I)
+
 
 def _has_date(text):
     """True if the text carries a game date in either supported form."""
@@ -454,6 +664,75 @@ KNOWN_GAME_CLASSES = (
 )
 
 
+def _compile_selectors(*selectors):
+    """soupsieve matchers for CSS selectors, compiled once at import."""
+    return tuple(sv.compile(sel) for sel in selectors)
+
+
+# Field selectors inside a game row, most specific first.  Compiled up front,
+# so the per-row calls go straight to matching instead of through
+# Tag.select_one's selector lookup.
+DATE_SELECTORS = _compile_selectors('.sidearm-schedule-game-opponent-date', '[class*="date"]', 'time')
+TIME_SELECTORS = _compile_selectors('.sidearm-schedule-game-opponent-time', '[class*="time"]', '.kickoff')
+OPPONENT_SELECTORS = _compile_selectors(
+    '.sidearm-schedule-game-opponent-name',
+    '[class*="opponent-name"]',
+    '[class*="team__name"]',
+    '[class*="team-name"]',
+    '[class*="opponent"]',
+)
+BROADCAST_SELECTORS = _compile_selectors(
+    '[class*="tv-network"]',
+    '[class*="tv-networks"]',
+    '[class*="tv-link"]',
+    '[class*="broadcast"]',
+    '[class*="network"]',
+)
+LOCATION_SELECTORS = _compile_selectors(
+    '[class*="venue-text"]', '[class*="location-text"]', '[class*="location"]', '[class*="venue"]'
+)
+# A row marks only one side, so both markers can be matched in a single walk.
+VENUE_SIDE_SELECTOR = sv.compile('[class*="venue--away"], [class*="venue--home"]')
+ISO_TIME_SELECTOR = sv.compile('time[datetime]')
+
+# ESPN layouts that wrap the schedule table, as one selector group so the page
+# is walked once rather than once per layout.
+ESPN_SCHEDULE_CONTAINERS = sv.compile('.Schedule, .ScheduleEvents, .TeamSchedule, [data-module="Schedule"]')
+
+
+def _first_selected_text(elem, selectors):
+    """Text of the element matched by the first selector that matches anything."""
+    for sel in selectors:
+        el = sel.select_one(elem)
+        if el:
+            return el.get_text(' ', strip=True)
+    return ""
+
+
+def _iso_matches_shown_date(iso_str, shown_date):
+    """True unless the ISO value's Eastern date contradicts the row's "Sept. 5"-style date."""
+    m = _MONTH_DAY_RE.search(shown_date) if shown_date else None
+    if m is None:
+        return True  # Nothing visible to check against
+    try:
+        kickoff, _ = _iso_eastern(iso_str)
+    except (ValueError, OverflowError):
+        return False
+    return (kickoff.month, kickoff.day) == (_MONTH_NUMBERS[m.group(1).lower()], int(m.group(2)))
+
+
+def _first_selected_match(elem, selectors, pattern, text):
+    """pattern's group 1 from the first selected field carrying it, else from the row text."""
+    for sel in selectors:
+        el = sel.select_one(elem)
+        if el:
+            m = pattern.search(el.get_text(' ', strip=True))
+            if m:
+                return m.group(1)
+    m = pattern.search(text)
+    return m.group(1) if m else ""
+
+
 def find_game_elements(soup):
     """
     Detect game elements by known SIDEARM row classes, then fall back to
@@ -462,9 +741,14 @@ def find_game_elements(soup):
     """
     from collections import Counter
 
-    # Fast path: the current gopsusports template tags each game row.
-    for class_name in KNOWN_GAME_CLASSES:
-        elems = soup.find_all(class_=class_name)
+    # Fast path: the current gopsusports template tags each game row.  Collect
+    # every known row class in one walk, then try them in priority order.
+    by_class = {class_name: [] for class_name in KNOWN_GAME_CLASSES}
+    for elem in soup.find_all(class_=KNOWN_GAME_CLASSES):
+        for class_name in elem.get('class', ()):
+            if class_name in by_class:
+                by_class[class_name].append(elem)
+    for class_name, elems in by_class.items():
         if len(elems) < 6:
             continue
         dated = [e for e in elems if _has_date(e.get_text())]
@@ -485,14 +769,15 @@ def find_game_elements(soup):
             continue
         key = (elem.name, ' '.join(sorted(elem.get('class', []))))
         counts[key] += 1
-        by_key.setdefault(key, []).append(elem)
+        # Keep the text alongside the element; the date check below reuses it
+        # instead of walking the subtree again.
+        by_key.setdefault(key, []).append((elem, text))
 
     best, best_score = [], 0
     for key, count in counts.items():
         if not (6 <= count <= 30):
             continue
-        elems = by_key[key]
-        dated = [e for e in elems if _has_date(e.get_text())]
+        dated = [e for e, text in by_key[key] if _has_date(text)]
         if len(dated) >= 6 and len(dated) > best_score:
             best_score = len(dated)
             best = dated
@@ -521,51 +806,31 @@ def extract_game_data(elem):
         text = elem.get_text(' ', strip=True)
 
         # --- Date ---
-        date_str = ""
-        for sel in ('.sidearm-schedule-game-opponent-date', '[class*="date"]', 'time'):
-            el = elem.select_one(sel)
-            if el:
-                m = _DATE_RE.search(el.get_text())
-                if m:
-                    date_str = m.group(1)
-                    break
-        if not date_str:
-            m = _DATE_RE.search(text)
-            if m:
-                date_str = m.group(1)
+        # A machine-readable <time datetime="..."> beats the display text,
+        # unless it lands on another day than the row shows: then it is a
+        # date-only placeholder and the visible date and time cells win.
+        time_el = ISO_TIME_SELECTOR.select_one(elem)
+        iso_str = time_el['datetime'].strip() if time_el is not None else ""
+        shown_date = _first_selected_match(elem, DATE_SELECTORS, _DATE_RE, text)
+        if _ISO_DATE_RE.match(iso_str) and _iso_matches_shown_date(iso_str, shown_date):
+            date_str = iso_str
+        else:
+            date_str = shown_date
         if not date_str:
             return None
 
         # --- Time ---
-        time_str = ""
-        for sel in ('.sidearm-schedule-game-opponent-time', '[class*="time"]', '.kickoff'):
-            el = elem.select_one(sel)
-            if el:
-                t = el.get_text(strip=True)
-                if t.upper() not in ('TBA', 'TBD', 'TIME TBA', 'TIME TBD', ''):
-                    m = _TIME_RE.search(t)
-                    if m:
-                        time_str = m.group(1)
-                        break
-        if not time_str:
-            m = _TIME_RE.search(text)
-            if m:
-                time_str = m.group(1)
+        # "TBA" cells carry no clock, so they fall through to the row text.
+        time_str = _first_selected_match(elem, TIME_SELECTORS, _TIME_RE, text)
 
         # --- Opponent ---
         # The current template lists both teams in the row, so take the first
         # name that is not Penn State itself.
         opponent = ""
-        for sel in (
-            '.sidearm-schedule-game-opponent-name',
-            '[class*="opponent-name"]',
-            '[class*="team__name"]',
-            '[class*="team-name"]',
-            '[class*="opponent"]',
-        ):
-            for el in elem.select(sel):
-                t = re.sub(r'^\s*#?\d+\s*', '', el.get_text(' ', strip=True))
-                t = re.sub(r'\s*\(\d+\)\s*', '', t).strip()
+        for sel in OPPONENT_SELECTORS:
+            for el in sel.iselect(elem):
+                t = _LEADING_RANK_RE.sub('', el.get_text(' ', strip=True))
+                t = _PAREN_RANK_RE.sub('', t).strip()
                 if len(t) < 2 or t.upper() in ('TBA', 'TBD'):
                     continue
                 if 'penn state' in t.lower() or t.upper() == 'PSU':
@@ -577,68 +842,48 @@ def extract_game_data(elem):
 
         if not opponent:
             # Regex fallback: capitalized word(s) after "vs." or "at"
-            m = re.search(
-                r'(?:vs\.?\s+|at\s+|@\s+)([A-Z][A-Za-z\s&\-\'\.]{1,40})',
-                text,
-            )
+            m = _OPPONENT_AFTER_VS_RE.search(text)
             if m:
                 # Trim trailing noise (location text, digits)
-                candidate = re.split(r'\s{2,}|\n|\d', m.group(1))[0].strip()
+                candidate = _OPPONENT_NOISE_RE.split(m.group(1))[0].strip()
                 if len(candidate) >= 2:
                     opponent = candidate
 
         if not opponent or len(opponent) < 2 or opponent.upper() in ('TBA', 'TBD', 'BYE'):
-            logger.debug(f"No valid opponent found; text snippet: {text[:120]}")
+            logger.debug("No valid opponent found; text snippet: %s", text[:120])
             return None
 
         # Clean stray prefixes
-        opponent = re.sub(r'^(vs\.?\s*|at\s*|@\s*)', '', opponent, flags=re.IGNORECASE).strip()
+        opponent = _VS_AT_PREFIX_RE.sub('', opponent).strip()
 
         # --- Broadcast ---
         # SIDEARM shows "TBA" in the TV slot until the network is assigned; that
         # is a broadcaster placeholder, not schedule data, so drop it.
         broadcast = ""
-        for sel in (
-            '[class*="tv-network"]',
-            '[class*="tv-networks"]',
-            '[class*="tv-link"]',
-            '[class*="broadcast"]',
-            '[class*="network"]',
-        ):
-            el = elem.select_one(sel)
-            if not el:
-                continue
-            t = re.sub(r'^\s*(TV|Watch|Live)\s*:\s*', '', el.get_text(' ', strip=True), flags=re.I).strip()
-            if t and t.upper() not in ('TBA', 'TBD', 'TV TBA'):
-                broadcast = t
-            break
+        t = _BROADCAST_LABEL_RE.sub('', _first_selected_text(elem, BROADCAST_SELECTORS)).strip()
+        if t and t.upper() not in ('TBA', 'TBD', 'TV TBA'):
+            broadcast = t
 
         # --- Location ---
-        location = ""
-        for sel in ('[class*="venue-text"]', '[class*="location-text"]', '[class*="location"]', '[class*="venue"]'):
-            el = elem.select_one(sel)
-            if el:
-                t = el.get_text(' ', strip=True)
-                if t and t.upper() not in ('TBA', 'TBD'):
-                    location = t
-                break
+        location = _first_selected_text(elem, LOCATION_SELECTORS)
+        if location.upper() in ('TBA', 'TBD'):
+            location = ""
 
         # --- Home/Away ---
         # The template marks the venue side explicitly; fall back to text cues.
         text_lower = text.lower()
-        if elem.select_one('[class*="venue--away"]'):
-            is_home = False
-        elif elem.select_one('[class*="venue--home"]'):
-            is_home = True
+        venue = VENUE_SIDE_SELECTOR.select_one(elem)
+        if venue is not None:
+            is_home = 'venue--home' in ' '.join(venue.get('class', ()))
         elif 'away' in text_lower:
             is_home = False
         elif 'home' in text_lower:
             is_home = True
-        elif re.search(r'\bvs\.?\s', text, re.I):
+        elif _HOME_VS_RE.search(text):
             is_home = True
         else:
             # "at" followed by capital letter → away
-            is_home = not bool(re.search(r'\bat\s+[A-Z]', text))
+            is_home = not bool(_AWAY_AT_RE.search(text))
 
         return {
             'date_str': date_str,
@@ -650,8 +895,8 @@ def extract_game_data(elem):
             'raw_text': text[:100],
         }
 
-    except Exception as e:
-        logger.error(f"Error extracting game data: {e}")
+    except (AttributeError, TypeError, ValueError) as e:
+        logger.error("Error extracting game data: %s", e)
         return None
 
 def scrape_penn_state_schedule(season=None):
@@ -661,6 +906,7 @@ def scrape_penn_state_schedule(season=None):
     
     logger.info(f"Scraping Penn State schedule for season {season}")
     games = []
+    seen = set()
     
     try:
         headers = get_sidearm_headers()
@@ -683,24 +929,26 @@ def scrape_penn_state_schedule(season=None):
                     logger.warning(f"No response from {url}")
                     continue
 
-                response_text_lower = response.text.lower()
+                # The markers are ASCII, so search the raw bytes rather than decoding
+                # the whole page to text first.
+                page_lower = response.content.lower()
                 # SIDEARM includes a hidden "Ad Blocker Detected" modal in normal pages; only
                 # treat ad-blocker copy as a wall when schedule markup is missing.
                 has_schedule_markup = (
-                    "sidearm-schedule-games" in response_text_lower
-                    or "sidearm-schedule-game" in response_text_lower
-                    or "schedule-event" in response_text_lower
+                    b"sidearm-schedule-games" in page_lower
+                    or b"sidearm-schedule-game" in page_lower
+                    or b"schedule-event" in page_lower
                 )
                 adblock_wall_copy = (
-                    "ad blocker" in response_text_lower
-                    or "blocks ads hinders" in response_text_lower
+                    b"ad blocker" in page_lower
+                    or b"blocks ads hinders" in page_lower
                 )
                 if response.status_code == 403 or (adblock_wall_copy and not has_schedule_markup):
                     logger.warning(f"Bot/ad blocker detection triggered for {url}")
                     continue
                 
                 response.raise_for_status()
-                soup = BeautifulSoup(response.text, 'html.parser')
+                soup = BeautifulSoup(response.content, HTML_PARSER, from_encoding=declared_encoding(response))
 
                 game_elements = find_game_elements(soup)
                 if not game_elements:
@@ -730,25 +978,31 @@ def scrape_penn_state_schedule(season=None):
                     game_datetime = parse_date_time(game_data['date_str'], game_data['time_str'], season)
                     
                     if not game_datetime:
-                        logger.warning(f"Failed to parse datetime for {title}, SKIPPING game")
+                        logger.warning("Failed to parse datetime for %s, SKIPPING game", title)
                         continue
                     
-                    duration = datetime.timedelta(hours=3, minutes=30)
-                    
-                    game_info = {
-                        'title': title,
-                        'start': game_datetime,  # Already timezone-aware in Eastern Time
-                        'end': game_datetime + duration,  # This will also be timezone-aware
-                        'location': location,
-                        'broadcast': game_data.get('broadcast', ''),
-                        'is_home': is_home,
-                        'opponent': opponent,
-                        'date_str': game_data['date_str'],
-                        'time_str': game_data['time_str']
-                    }
+                    # The same game can be listed twice (e.g. desktop and mobile markup).
+                    key = (game_datetime.date(), opponent)
+                    if key in seen:
+                        logger.debug("Skipping duplicate listing: %s on %s", title, key[0])
+                        continue
+                    seen.add(key)
+
+                    game_info = Game(
+                        title=title,
+                        start=game_datetime,  # Already timezone-aware in Eastern Time
+                        end=game_datetime + GAME_DURATION,  # This will also be timezone-aware
+                        location=location,
+                        broadcast=game_data.get('broadcast', ''),
+                        is_home=is_home,
+                        opponent=opponent,
+                        date_str=game_data['date_str'],
+                        time_str=game_data['time_str'],
+                        source_url=url,
+                    )
                     
                     games.append(game_info)
-                    logger.info(f"Successfully scraped: {title} on {game_datetime}")
+                    logger.info("Successfully scraped: %s on %s", title, game_datetime)
                 
                 if games:
                     logger.info(f"Successfully scraped {len(games)} games from {url}")
@@ -770,6 +1024,7 @@ def scrape_espn_schedule(season=None):
     
     logger.info(f"Scraping ESPN for Penn State season {season}")
     games = []
+    seen = set()
     
     try:
         headers = get_sidearm_headers()
@@ -787,9 +1042,9 @@ def scrape_espn_schedule(season=None):
             logger.warning("ESPN HTML: no response")
             return games
 
-        response_text_lower = response.text.lower()
+        page_lower = response.content.lower()
         if response.status_code == 202 or (
-            "awswaf" in response_text_lower and "challenge-container" in response_text_lower
+            b"awswaf" in page_lower and b"challenge-container" in page_lower
         ):
             logger.warning(
                 "ESPN returned an AWS WAF challenge page instead of schedule HTML "
@@ -799,7 +1054,7 @@ def scrape_espn_schedule(season=None):
         
         response.raise_for_status()
         
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = BeautifulSoup(response.content, HTML_PARSER, from_encoding=declared_encoding(response))
         
         # ESPN schedule parsing - try multiple table formats
         table = soup.find('table', class_='Table')
@@ -810,19 +1065,10 @@ def scrape_espn_schedule(season=None):
         
         if not table:
             # Try alternative ESPN layout - look for schedule containers
-            schedule_containers = [
-                '.Schedule',
-                '.ScheduleEvents',
-                '.TeamSchedule',
-                '[data-module="Schedule"]'
-            ]
-            
-            for container_sel in schedule_containers:
-                container = soup.select_one(container_sel)
-                if container:
-                    table = container.find('table')
-                    if table:
-                        break
+            for container in ESPN_SCHEDULE_CONTAINERS.iselect(soup):
+                table = container.find('table')
+                if table:
+                    break
         
         if not table:
             # Last resort - find any table
@@ -840,11 +1086,11 @@ def scrape_espn_schedule(season=None):
                         date_str = cells[0].get_text(strip=True)
                         opponent_cell = cells[1]
                         
-                        logger.debug(f"ESPN row {i}: Raw date='{date_str}'")
+                        logger.debug("ESPN row %s: Raw date='%s'", i, date_str)
                         
                         # Skip if this is a header row or separator
                         if not date_str or date_str.lower() in ['date', 'day', 'week']:
-                            logger.debug(f"Skipping header/separator row: {date_str}")
+                            logger.debug("Skipping header/separator row: %s", date_str)
                             continue
                         
                         # Get full opponent text including vs/@ indicator
@@ -858,27 +1104,27 @@ def scrape_espn_schedule(season=None):
                             if len(linked_opponent) > len(opponent_full_text.replace('vs ', '').replace('@ ', '')):
                                 opponent_full_text = opponent_full_text.replace(linked_opponent, '').strip() + ' ' + linked_opponent
                         
-                        logger.debug(f"ESPN row {i}: date='{date_str}', opponent_full='{opponent_full_text}'")
+                        logger.debug("ESPN row %s: date='%s', opponent_full='%s'", i, date_str, opponent_full_text)
                         
                         # STRICT: Skip bye weeks and invalid entries
-                        if not opponent_full_text or any(invalid in opponent_full_text.lower() for invalid in ['bye', 'open', 'tbd', 'tba']):
-                            logger.debug(f"Skipping invalid ESPN entry: {opponent_full_text}")
+                        if not opponent_full_text or _ESPN_NON_GAME_RE.search(opponent_full_text):
+                            logger.debug("Skipping invalid ESPN entry: %s", opponent_full_text)
                             continue
                         
                         # Extract time from TIME column (usually column 2)
                         time_str = ""
                         if len(cells) > 2:
                             time_cell_text = cells[2].get_text(strip=True)
-                            logger.debug(f"ESPN row {i}: Raw time='{time_cell_text}'")
+                            logger.debug("ESPN row %s: Raw time='%s'", i, time_cell_text)
                             
                             # Look for time patterns like "3:30 PM" or "12:00 PM"
-                            if re.search(r'\d+:\d+\s*[AP]M', time_cell_text, re.IGNORECASE):
+                            if _ESPN_CLOCK_RE.search(time_cell_text):
                                 time_str = time_cell_text
                             # Handle "TBA" or "TBD" time indicators
                             elif time_cell_text.upper() in ['TBA', 'TBD', 'TIME TBA']:
                                 time_str = ""  # Will default to 1pm
                             else:
-                                logger.debug(f"Unrecognized time format: '{time_cell_text}', will use 1pm default")
+                                logger.debug("Unrecognized time format: '%s', will use 1pm default", time_cell_text)
                         
                         # Determine home/away from vs/@ indicator in opponent text
                         is_away = False
@@ -889,23 +1135,23 @@ def scrape_espn_schedule(season=None):
                         elif opponent_full_text.startswith('vs'):
                             is_away = False
                             # Remove vs prefix
-                            opponent_clean = re.sub(r'^vs\s+', '', opponent_full_text, flags=re.IGNORECASE).strip()
+                            opponent_clean = _VS_PREFIX_RE.sub('', opponent_full_text).strip()
                         else:
                             # Fallback: look for @ or vs anywhere in the text
                             if '@' in opponent_full_text or 'at ' in opponent_full_text.lower():
                                 is_away = True
-                            opponent_clean = re.sub(r'^(vs\.?\s*|@\s*|at\s*)', '', opponent_full_text, flags=re.IGNORECASE).strip()
+                            opponent_clean = _VS_AT_PREFIX_RE.sub('', opponent_full_text).strip()
                         
                         # Remove common ESPN formatting artifacts (rankings, etc.)
-                        opponent_clean = re.sub(r'\s*\(\d+\)\s*', '', opponent_clean)  # Remove rankings like "(5)"
-                        opponent_clean = re.sub(r'\s*#\d+\s*', '', opponent_clean)     # Remove rankings like "#5"
-                        opponent_clean = re.sub(r'^\d+\s+', '', opponent_clean)       # Remove ranking numbers at start
+                        opponent_clean = _PAREN_RANK_RE.sub('', opponent_clean)  # Remove rankings like "(5)"
+                        opponent_clean = _HASH_RANK_RE.sub('', opponent_clean)     # Remove rankings like "#5"
+                        opponent_clean = _LEADING_NUMBER_RE.sub('', opponent_clean)  # Remove ranking numbers at start
                         
-                        logger.debug(f"ESPN row {i}: is_away={is_away}, opponent_clean='{opponent_clean}'")
+                        logger.debug("ESPN row %s: is_away=%s, opponent_clean='%s'", i, is_away, opponent_clean)
                         
                         # STRICT: Must have valid opponent after cleaning
                         if not opponent_clean or len(opponent_clean) < 2:
-                            logger.debug(f"Invalid opponent after cleaning: '{opponent_clean}' from '{opponent_full_text}'")
+                            logger.debug("Invalid opponent after cleaning: '%s' from '%s'", opponent_clean, opponent_full_text)
                             continue
                         
                         # Build game title and location
@@ -920,39 +1166,42 @@ def scrape_espn_schedule(season=None):
                         game_datetime = parse_date_time(date_str, time_str, season)
                         
                         if not game_datetime:
-                            logger.warning(f"Could not parse ESPN datetime for {title}: date='{date_str}', time='{time_str}' - SKIPPING")
+                            logger.warning("Could not parse ESPN datetime for %s: date='%s', time='%s' - SKIPPING", title, date_str, time_str)
                             continue
                         
-                        duration = datetime.timedelta(hours=3, minutes=30)
-                        
-                        game_info = {
-                            'title': title,
-                            'start': game_datetime,  # Already timezone-aware in Eastern Time
-                            'end': game_datetime + duration,  # This will also be timezone-aware
-                            'location': location,
-                            'broadcast': "",
-                            'is_home': not is_away,
-                            'opponent': opponent_clean,
-                            'date_str': date_str,
-                            'time_str': time_str if time_str else "1:00 PM"  # Show default in logs
-                        }
+                        # Skip a row already taken for this date and opponent.
+                        key = (game_datetime.date(), opponent_clean)
+                        if key in seen:
+                            logger.debug("Skipping duplicate listing: %s on %s", title, key[0])
+                            continue
+                        seen.add(key)
+
+                        game_info = Game(
+                            title=title,
+                            start=game_datetime,  # Already timezone-aware in Eastern Time
+                            end=game_datetime + GAME_DURATION,  # This will also be timezone-aware
+                            location=location,
+                            broadcast="",
+                            is_home=not is_away,
+                            opponent=opponent_clean,
+                            date_str=date_str,
+                            time_str=time_str if time_str else "1:00 PM",  # Show default in logs
+                            source_url=url,
+                        )
                         
                         games.append(game_info)
-                        logger.info(f"ESPN: Successfully scraped {title} on {game_datetime.strftime('%Y-%m-%d %H:%M')}")
+                        logger.info("ESPN: Successfully scraped %s on %s", title, game_datetime.strftime('%Y-%m-%d %H:%M'))
                         
-                except Exception as e:
-                    logger.error(f"Error parsing ESPN row {i}: {e}")
-                    # Log the row content for debugging
-                    try:
-                        row_text = row.get_text(strip=True)
-                        logger.debug(f"Problematic row content: '{row_text}'")
-                    except:
-                        pass
+                except (AttributeError, IndexError, TypeError, ValueError) as e:
+                    logger.error("Error parsing ESPN row %s: %s", i, e)
+                    # Log the row content for debugging; only walk the row when it will be shown
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Problematic row content: '%s'", row.get_text(strip=True))
                     continue
         else:
             logger.error("ESPN: No schedule table found on page")
             # Log some page content for debugging
-            logger.debug(f"Page title: {soup.title.string if soup.title else 'No title'}")
+            logger.debug("Page title: %s", soup.title.string if soup.title else 'No title')
             
         
     except Exception as e:
@@ -998,6 +1247,7 @@ def scrape_espn_api(season=None):
 
     logger.info(f"Trying ESPN API for season {season}")
     games = []
+    seen = set()
 
     try:
         # Spread across ESPN's API hosts: they sit behind different edges, so a
@@ -1037,8 +1287,6 @@ def scrape_espn_api(season=None):
         events = _find_events_in_espn_json(data)
         logger.info(f"ESPN API: found {len(events)} events")
 
-        eastern_tz = ZoneInfo("America/New_York")
-
         for event in events:
             try:
                 competition = event.get('competitions', [{}])[0]
@@ -1074,10 +1322,10 @@ def scrape_espn_api(season=None):
                 # When timeValid is False ESPN sends midnight UTC — use 1pm ET default instead
                 time_valid = competition.get('timeValid', True)
                 if not time_valid:
-                    date_et = dt_utc.astimezone(eastern_tz).date()
-                    game_datetime = datetime.datetime(date_et.year, date_et.month, date_et.day, 13, 0, tzinfo=eastern_tz)
+                    date_et = dt_utc.astimezone(EASTERN_TZ).date()
+                    game_datetime = datetime.datetime(date_et.year, date_et.month, date_et.day, 13, 0, tzinfo=EASTERN_TZ)
                 else:
-                    game_datetime = dt_utc.astimezone(eastern_tz)
+                    game_datetime = dt_utc.astimezone(EASTERN_TZ)
 
                 venue = competition.get('venue', {})
                 venue_name = venue.get('fullName', '')
@@ -1097,23 +1345,30 @@ def scrape_espn_api(season=None):
                 else:
                     title = f"Penn State at {opponent}"
 
-                duration = datetime.timedelta(hours=3, minutes=30)
-                game_info = {
-                    'title': title,
-                    'start': game_datetime,
-                    'end': game_datetime + duration,
-                    'location': location,
-                    'broadcast': broadcast,
-                    'is_home': is_home,
-                    'opponent': opponent,
-                    'date_str': date_str,
-                    'time_str': game_datetime.strftime('%I:%M %p %Z'),
-                }
+                # One event per date and opponent, however many times the feed lists it.
+                key = (game_datetime.date(), opponent)
+                if key in seen:
+                    logger.debug("Skipping duplicate listing: %s on %s", title, key[0])
+                    continue
+                seen.add(key)
+
+                game_info = Game(
+                    title=title,
+                    start=game_datetime,
+                    end=game_datetime + GAME_DURATION,
+                    location=location,
+                    broadcast=broadcast,
+                    is_home=is_home,
+                    opponent=opponent,
+                    date_str=date_str,
+                    time_str=game_datetime.strftime('%I:%M %p %Z'),
+                    source_url=api_url,
+                )
                 games.append(game_info)
-                logger.info(f"ESPN API: {title} on {game_datetime.strftime('%Y-%m-%d %H:%M %Z')}")
+                logger.info("ESPN API: %s on %s", title, game_datetime.strftime('%Y-%m-%d %H:%M %Z'))
 
-            except Exception as e:
-                logger.error(f"Error parsing ESPN API event: {e}")
+            except (AttributeError, IndexError, KeyError, TypeError, ValueError) as e:
+                logger.error("Error parsing ESPN API event: %s", e)
                 continue
 
     except Exception as e:
@@ -1166,66 +1421,173 @@ def scrape_schedule(season=None):
     logger.error("Calendar will be EMPTY due to parsing failure")
     return []
 
+CALENDAR_PRODID = "-//Penn State Football Schedule//EN"
+
+# RFC 5545 TEXT escaping for SUMMARY / LOCATION / DESCRIPTION values.
+_ICS_ESCAPES = str.maketrans({'\\': '\\\\', ';': '\\;', ',': '\\,', '\n': '\\n'})
+_UID_SLUG_RE = re.compile(r'[^a-z0-9]+')
+
+
+def _ics_text(value):
+    return value.translate(_ICS_ESCAPES)
+
+
+def _ics_utc(dt):
+    """DATE-TIME in UTC form, e.g. 20260905T193000Z."""
+    return dt.astimezone(datetime.timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+
+
+def _ics_fold(line):
+    """Fold a content line longer than 75 octets (RFC 5545 section 3.1)."""
+    if len(line.encode('utf-8')) <= 75:
+        return line
+    chunks, current, size = [], '', 0
+    for ch in line:
+        width = len(ch.encode('utf-8'))
+        if size + width > 75:
+            chunks.append(current)
+            # Continuation lines start with a space, which counts toward the 75
+            current, size = ' ', 1
+        current += ch
+        size += width
+    chunks.append(current)
+    return '\r\n'.join(chunks)
+
+
+def _event_uid(game):
+    """Stable UID, so a re-scrape of the same game is the same calendar event."""
+    slug = _UID_SLUG_RE.sub('-', game.opponent.lower()).strip('-')
+    return f"{game.start:%Y%m%d}-{slug}@psu-football"
+
+
+def _event_description(game):
+    """DESCRIPTION text: broadcast, home/away, opponent and the kickoff's time zone."""
+    parts = [f"Broadcast: {game.broadcast}"] if game.broadcast else []
+    parts.append("Home Game" if game.is_home else "Away Game")
+    if game.opponent:
+        parts.append(f"Opponent: {game.opponent}")
+    # Add timezone info to description for clarity
+    parts.append(f"Time Zone: {game.start:%Z %z}")
+    return "\n".join(parts)
+
+
+def _calendar_digest(data):
+    """blake2b of a serialized calendar; events are emitted in start order, so equal schedules hash equal."""
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def write_calendar_file(content):
+    """
+    Write CALENDAR_FILE atomically (temp file + os.replace), skipping the write
+    when the events match what is already on disk so subscribers and the
+    workflow's change check see no churn.  Returns True if the file changed.
+    """
+    # Encode once; the comparison and the write both use these bytes, and
+    # binary mode keeps the CRLF line endings exactly as serialized.
+    data = content.encode('utf-8')
+    try:
+        with open(CALENDAR_FILE, 'rb') as f:
+            if f.read() == data:
+                logger.info(f"Calendar content unchanged - not rewriting {CALENDAR_FILE}")
+                return False
+    except OSError:
+        pass  # No previous calendar
+
+    tmp_file = CALENDAR_FILE + ".tmp"
+    try:
+        with open(tmp_file, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, CALENDAR_FILE)
+    except OSError:
+        # Don't leave a half-written temp file next to the calendar
+        try:
+            os.remove(tmp_file)
+        except OSError:
+            pass
+        raise
+    return True
+
+
 def create_calendar(games):
-    """Create iCalendar file with timezone-aware events - empty if no games provided"""
-    cal = Calendar()
-    cal._prodid = "Penn State Football Schedule"
+    """
+    Write the iCalendar (RFC 5545) file with one VEVENT per game, in kickoff
+    order - empty if no games provided.  Returns the calendar text.
+    """
+    lines = ['BEGIN:VCALENDAR', 'VERSION:2.0', f'PRODID:{CALENDAR_PRODID}']
     
     if not games:
         logger.warning("Creating EMPTY calendar due to scraping failure")
         # Create empty calendar
-        with open(CALENDAR_FILE, 'w') as f:
-            f.write(cal.serialize())
-        return cal
+        lines.append('END:VCALENDAR')
+        content = '\r\n'.join(lines) + '\r\n'
+        write_calendar_file(content)
+        return content
     
-    for game in games:
-        event = Event()
-        event.name = game['title']
-        
-        # Events are already timezone-aware in Eastern Time from parse_date_time()
-        event.begin = game['start']  # ics library will handle timezone conversion properly
-        event.end = game['end']      # ics library will handle timezone conversion properly
-        
-        event.location = game['location']
-        
-        description = ""
-        if game['broadcast']:
-            description += f"Broadcast: {game['broadcast']}\n"
-        description += "Home Game" if game['is_home'] else "Away Game"
-        if game['opponent']:
-            description += f"\nOpponent: {game['opponent']}"
-        
-        # Add timezone info to description for clarity
-        timezone_info = game['start'].strftime('%Z %z') if hasattr(game['start'], 'strftime') else "ET"
-        description += f"\nTime Zone: {timezone_info}"
-            
-        event.description = description
-        cal.events.add(event)
+    for game in sorted(games, key=lambda g: g.start):
+        # Start/end are timezone-aware Eastern datetimes; emit them as UTC
+        lines.append('BEGIN:VEVENT')
+        lines.append(f'UID:{_event_uid(game)}')
+        # DTSTAMP is required; derive it from the kickoff rather than the clock
+        # so an unchanged schedule serializes to identical bytes.
+        lines.append(f'DTSTAMP:{_ics_utc(game.start)}')
+        lines.append(f'DTSTART:{_ics_utc(game.start)}')
+        lines.append(f'DTEND:{_ics_utc(game.end)}')
+        lines.append(f'SUMMARY:{_ics_text(game.title)}')
+        if game.location:
+            lines.append(f'LOCATION:{_ics_text(game.location)}')
+        lines.append(f'DESCRIPTION:{_ics_text(_event_description(game))}')
+        lines.append('END:VEVENT')
+    lines.append('END:VCALENDAR')
     
-    with open(CALENDAR_FILE, 'w') as f:
-        calendar_content = cal.serialize()
-        f.write(calendar_content)
+    content = '\r\n'.join(_ics_fold(line) for line in lines) + '\r\n'
+    write_calendar_file(content)
     
     logger.info(f"Calendar created with {len(games)} timezone-aware events")
     
     # Log first event details for verification
     if games:
         first_game = games[0]
-        logger.info(f"First event: {first_game['title']} at {first_game['start']} ({first_game['start'].tzinfo})")
+        logger.info(f"First event: {first_game.title} at {first_game.start} ({first_game.start.tzinfo})")
     
-    return cal
+    return content
 
 def update_calendar(custom_season=None):
     """Update the calendar with STRICT validation"""
     try:
         season = custom_season or get_current_season()
+
+        # Nothing to rebuild if the page the calendar came from has not changed.
+        cache = load_http_cache()
+        if cache.get('season') == season and calendar_matches_cache(cache) and source_unchanged(cache):
+            logger.info(f"Schedule source unchanged since last update ({cache['url']}) - keeping {CALENDAR_FILE}")
+            return True
+
+        # The calendar is about to be rewritten; until it is re-saved below the
+        # cache no longer describes it (a failed scrape writes an empty one).
+        clear_http_cache()
+
         games = scrape_schedule(season)
         
         # Always create calendar, even if empty
-        create_calendar(games)
+        content = create_calendar(games)
         
         if games:
             logger.info(f"Calendar updated successfully with {len(games)} validated games")
+            source_url = games[0].source_url
+            if source_url in RESPONSE_VALIDATORS:
+                try:
+                    save_http_cache({
+                        'version': HTTP_CACHE_VERSION,
+                        'season': season,
+                        'url': source_url,
+                        'calendar_digest': _calendar_digest(content.encode('utf-8')).hex(),
+                        **RESPONSE_VALIDATORS[source_url],
+                    })
+                except OSError as e:
+                    logger.warning(f"Could not save HTTP cache: {e}")
+                    clear_http_cache()
             return True
         else:
             logger.warning("Calendar updated with 0 games due to parsing failures")
@@ -1234,6 +1596,7 @@ def update_calendar(custom_season=None):
     except Exception as e:
         logger.error(f"Error updating calendar: {str(e)}")
         # Create empty calendar on error
+        clear_http_cache()
         create_calendar([])
         return False
 
@@ -1243,7 +1606,7 @@ if __name__ == "__main__":
     logger.info(f"Starting Penn State Football Schedule Scraper for season {current_season}")
     logger.info("Using STRICT parsing - calendar will be empty if parsing fails")
     
-    success = update_calendar()
+    success = update_calendar(current_season)
     if success:
         print(f"Calendar updated successfully for season {current_season}")
     else:
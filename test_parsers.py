@@ -15,6 +15,7 @@ import sys
 from bs4 import BeautifulSoup
 
 from Script import (
+    HTML_PARSER,
     _DATE_RE,
     extract_game_data,
     find_game_elements,
@@ -106,12 +107,99 @@ def test_season_rollover() -> bool:
     explicit = parse_date_time("2026-09-05", "3:30 PM", 2026)
     ok &= check("explicit 2026-09-05 unchanged", explicit is not None and explicit.year == 2026,
                 str(explicit))
+    written_year = parse_date_time("Sat, Sep 6, 2025", "", 2026)
+    ok &= check("year in the date string wins", written_year is not None and written_year.year == 2025,
+                str(written_year))
+    ok &= check("repeat parse served from cache",
+                parse_date_time("Nov. 21", "12:00 PM", 2026) is november)
+    ok &= check("cache is keyed by season",
+                parse_date_time("Nov. 21", "12:00 PM", 2025).year == 2025)
+    return ok
+
+
+def test_kickoff_times() -> bool:
+    print("Kickoff clocks convert to 24-hour Eastern time:")
+    ok = True
+    for time_text, expected in [
+        ("3:30 PM", (15, 30)),
+        ("12:00 PM", (12, 0)),
+        ("12:00 AM", (0, 0)),
+        ("8 PM", (20, 0)),
+        ("7:00", (19, 0)),
+        ("8:00 p.m.", (20, 0)),
+        ("Kickoff 3:30 PM", (15, 30)),
+        ("TV: 7:00", (19, 0)),
+        ("7 at", (19, 0)),
+        ("10:30 PT", (10, 30)),
+        ("TBA", (13, 0)),
+    ]:
+        parsed = parse_date_time("Sept. 5", time_text, 2026)
+        got = (parsed.hour, parsed.minute) if parsed else None
+        ok &= check(f"{time_text!r} -> {expected}", got == expected, f"got {got}")
+    return ok
+
+
+def test_iso_datetime_attribute() -> bool:
+    print("ISO <time datetime> values are read directly:")
+    ok = True
+    utc = parse_date_time("2026-09-05T23:30:00Z", "", 2026)
+    ok &= check("UTC kickoff converted to Eastern", utc is not None and (utc.hour, utc.minute) == (19, 30),
+                str(utc))
+    placeholder = parse_date_time("2026-09-05T00:00:00", "3:30 PM", 2026)
+    ok &= check("midnight placeholder takes the time cell",
+                placeholder is not None and (placeholder.hour, placeholder.minute) == (15, 30),
+                str(placeholder))
+    # Midnight UTC is ESPN's "kickoff not set": keep its Eastern date, take the clock
+    # from the time cell.  An 8pm EDT kickoff written that way stays on Sep 12.
+    primetime = parse_date_time("2026-09-13T00:00:00Z", "8:00 PM", 2026)
+    ok &= check("T00:00:00Z with time cell stays Sep 12 8:00 PM ET",
+                primetime is not None and (primetime.month, primetime.day, primetime.hour) == (9, 12, 20),
+                str(primetime))
+    unset = parse_date_time("2026-09-13T00:00:00Z", "", 2026)
+    ok &= check("T00:00:00Z without a time is Sep 12 1pm default",
+                unset is not None and (unset.month, unset.day, unset.hour) == (9, 12, 13),
+                str(unset))
+    for out_of_range in ("0001-01-01T01:00+05:00", "9999-12-31T23:59-12:00"):
+        ok &= check(f"{out_of_range!r} -> None", parse_date_time(out_of_range, "", 2026) is None)
+    row = BeautifulSoup(
+        '<div class="schedule-event"><time datetime="2026-09-12T16:00:00Z">Sept. 12</time>'
+        '<span class="sidearm-schedule-game-opponent-name">Temple</span></div>',
+        HTML_PARSER,
+    ).div
+    data = extract_game_data(row)
+    ok &= check("extract prefers the datetime attribute",
+                data is not None and data["date_str"] == "2026-09-12T16:00:00Z",
+                str(data and data["date_str"]))
+    # Date-only placeholder beside the visible "Sept. 5": as Eastern time it would
+    # be Fri Sep 4 8pm, so the row's own date and time cells must win.
+    for time_text, hour in (("3:30 PM", 15), ("TBA", 13)):
+        row = BeautifulSoup(
+            '<div class="schedule-event"><time datetime="2026-09-05T00:00:00Z"></time>'
+            '<span class="schedule-event-date__day">Sept. 5</span>'
+            f'<span class="schedule-event-date__time">{time_text}</span>'
+            '<span class="sidearm-schedule-game-opponent-name">Marshall</span></div>',
+            HTML_PARSER,
+        ).div
+        data = extract_game_data(row)
+        kickoff = data and parse_date_time(data["date_str"], data["time_str"], 2026)
+        ok &= check(f"UTC-midnight placeholder beside 'Sept. 5' / {time_text!r} lands on Sep 5",
+                    kickoff is not None and (kickoff.month, kickoff.day, kickoff.hour) == (9, 5, hour),
+                    str(kickoff))
+    return ok
+
+
+def test_bad_dates_return_none() -> bool:
+    print("Unparseable dates return None instead of raising:")
+    ok = True
+    for date_text in ["TBA", "Feb 30", "9/40", "2026-13-01", "Sat, Foo 31", "Aug 1234567890123", "\u017fep 5"]:
+        parsed = parse_date_time(date_text, "", 2026)
+        ok &= check(f"{date_text!r} -> None", parsed is None, str(parsed))
     return ok
 
 
 def test_sidearm_fixture() -> bool:
     print("SIDEARM fixture (current gopsusports DOM):")
-    soup = BeautifulSoup(_build_fixture(), "html.parser")
+    soup = BeautifulSoup(_build_fixture(), HTML_PARSER)
     elements = find_game_elements(soup)
     ok = check(f"found {len(elements)} game elements", len(elements) == 12)
     if not elements:
@@ -203,7 +291,9 @@ def test_espn_api_parsing() -> bool:
         # First endpoint is walled off, as it was in the failing build.
         if len(calls) == 1:
             return _FakeResponse({}, status_code=403)
-        return _FakeResponse(_espn_payload())
+        payload = _espn_payload()
+        payload["events"].append(payload["events"][0])  # listed twice
+        return _FakeResponse(payload)
 
     Script.http_get = fake_http_get
     try:
@@ -212,16 +302,139 @@ def test_espn_api_parsing() -> bool:
         Script.http_get = original
 
     ok = check("falls past a 403 endpoint to the next host", len(calls) >= 2, f"{len(calls)} calls")
-    ok &= check(f"parsed {len(games)} games", len(games) == 12)
+    ok &= check(f"parsed {len(games)} games, duplicate listing dropped", len(games) == 12)
     if games:
         ok &= check("home game titled '<opponent> at Penn State'",
-                    games[0]["title"] == "Marshall Thundering Herd at Penn State", games[0]["title"])
+                    games[0].title == "Marshall Thundering Herd at Penn State", games[0].title)
         ok &= check("away game titled 'Penn State at <opponent>'",
-                    games[1]["title"] == "Penn State at Temple Owls", games[1]["title"])
-        ok &= check("kickoff converted to Eastern", games[0]["start"].hour == 15,
-                    str(games[0]["start"]))
+                    games[1].title == "Penn State at Temple Owls", games[1].title)
+        ok &= check("kickoff converted to Eastern", games[0].start.hour == 15,
+                    str(games[0].start))
         ok &= check("midnight-UTC placeholder becomes 1pm ET",
-                    games[4]["start"].hour == 13, str(games[4]["start"]))
+                    games[4].start.hour == 13, str(games[4].start))
+    return ok
+
+
+def test_calendar_output() -> bool:
+    print("Calendar file is valid RFC 5545 text:")
+    import os
+    import tempfile
+
+    import Script
+
+    original_get, original_file = Script.http_get, Script.CALENDAR_FILE
+    Script.http_get = lambda url, **kwargs: _FakeResponse(_espn_payload())
+    try:
+        games = Script.scrape_espn_api(2026)
+        with tempfile.TemporaryDirectory() as tmp:
+            Script.CALENDAR_FILE = os.path.join(tmp, "calendar.ics")
+            content = Script.create_calendar(list(reversed(games)))
+            with open(Script.CALENDAR_FILE, encoding="utf-8", newline="") as f:
+                on_disk = f.read()
+
+            # A failed write keeps the old calendar and leaves no temp file behind.
+            original_fsync = os.fsync
+
+            def failing_fsync(fd):
+                raise OSError("disk full")
+
+            os.fsync = failing_fsync
+            try:
+                Script.write_calendar_file(content + "X")
+                raised = False
+            except OSError:
+                raised = True
+            finally:
+                os.fsync = original_fsync
+            with open(Script.CALENDAR_FILE, encoding="utf-8", newline="") as f:
+                kept = f.read() == content
+            failed_write_clean = raised and kept and os.listdir(tmp) == ["calendar.ics"]
+    finally:
+        Script.http_get, Script.CALENDAR_FILE = original_get, original_file
+
+    lines = content.split("\r\n")
+    ok = check("written file matches returned text", on_disk == content)
+    ok &= check("failed write leaves the old file and no .tmp", failed_write_clean)
+    ok &= check("wrapped in VCALENDAR", lines[0] == "BEGIN:VCALENDAR" and lines[-2] == "END:VCALENDAR")
+    ok &= check("one VEVENT per game", content.count("BEGIN:VEVENT") == 12)
+    uids = [line for line in lines if line.startswith("UID:")]
+    ok &= check("UIDs are unique", len(set(uids)) == 12, str(uids[:2]))
+    ok &= check("events emitted in kickoff order",
+                uids[0] == "UID:20260905-marshall-thundering-herd@psu-football", uids[0])
+    ok &= check("first kickoff written in UTC", "DTSTART:20260905T190000Z" in lines)
+    ok &= check("every VEVENT carries a DTSTAMP",
+                sum(line.startswith("DTSTAMP:") for line in lines) == 12 and "DTSTAMP:20260905T190000Z" in lines)
+    ok &= check("commas escaped in LOCATION",
+                "LOCATION:Beaver Stadium\\, University Park\\, PA" in lines)
+    ok &= check("no line longer than 75 octets",
+                all(len(line.encode("utf-8")) <= 75 for line in lines))
+    return ok
+
+
+def test_update_skip_cache() -> bool:
+    print("Unchanged-source skip only keeps a calendar the cache describes:")
+    import os
+    import tempfile
+
+    import Script
+
+    saved = (Script.http_get, Script.scrape_schedule, Script.CALENDAR_FILE, Script.HTTP_CACHE_FILE,
+             Script.HTTP_CACHE_VERSION, dict(Script.RESPONSE_VALIDATORS))
+    Script.http_get = lambda url, **kwargs: _FakeResponse(_espn_payload())
+    games = Script.scrape_espn_api(2026)
+    Script.RESPONSE_VALIDATORS[games[0].source_url] = {
+        "etag": '"v1"', "last_modified": "", "sha256": "", "accept_json": True,
+    }
+    scrape_results = []
+    probe = {"response": None}
+
+    def event_count():
+        with open(Script.CALENDAR_FILE, encoding="utf-8") as f:
+            return f.read().count("BEGIN:VEVENT")
+
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            Script.CALENDAR_FILE = os.path.join(tmp, "calendar.ics")
+            Script.HTTP_CACHE_FILE = os.path.join(tmp, ".cache", "psu_sched.json")
+            Script.scrape_schedule = lambda season: scrape_results.pop(0)
+            Script.http_get = lambda url, **kwargs: probe["response"]
+
+            scrape_results.append(games)
+            ok = check("run 1 writes the calendar", Script.update_calendar(2026) and event_count() == 12)
+            ok &= check("run 1 saves the cache", os.path.exists(Script.HTTP_CACHE_FILE))
+
+            probe["response"] = _FakeResponse({}, status_code=304)
+            ok &= check("unchanged source skips the scrape",
+                        Script.update_calendar(2026) and not scrape_results and event_count() == 12)
+
+            # Every source fails, the probe included: an empty calendar is written.
+            probe["response"] = None
+            scrape_results.append([])
+            ok &= check("run 2 fails with an empty calendar",
+                        not Script.update_calendar(2026) and event_count() == 0)
+            ok &= check("run 2 clears the cache", not os.path.exists(Script.HTTP_CACHE_FILE))
+
+            probe["response"] = _FakeResponse({}, status_code=304)
+            scrape_results.append(games)
+            ok &= check("run 3 re-scrapes instead of keeping the empty calendar",
+                        Script.update_calendar(2026) and event_count() == 12)
+
+            # A new version of the script re-serializes even an unchanged source.
+            Script.HTTP_CACHE_VERSION = "changed"
+            scrape_results.append(games)
+            ok &= check("script change invalidates the cache",
+                        Script.update_calendar(2026) and not scrape_results)
+
+            with open(Script.CALENDAR_FILE, "a", encoding="utf-8") as f:
+                f.write("edited\r\n")
+            scrape_results.append(games)
+            ok &= check("calendar changed on disk is rebuilt",
+                        Script.update_calendar(2026) and not scrape_results)
+    finally:
+        (Script.http_get, Script.scrape_schedule, Script.CALENDAR_FILE, Script.HTTP_CACHE_FILE,
+         Script.HTTP_CACHE_VERSION) = saved[:5]
+        Script.RESPONSE_VALIDATORS.clear()
+        Script.RESPONSE_VALIDATORS.update(saved[5])
     return ok
 
 
@@ -239,8 +452,13 @@ def main() -> None:
     results = [
         test_date_regex(),
         test_season_rollover(),
+        test_kickoff_times(),
+        test_iso_datetime_attribute(),
+        test_bad_dates_return_none(),
         test_sidearm_fixture(),
         test_espn_api_parsing(),
+        test_calendar_output(),
+        test_update_skip_cache(),
         test_http_get_survives_failure(),
     ]
     print()
@@ -71,8 +71,8 @@ def main() -> None:
     ok = validate_schedule(games, season)
     print(f"validate_schedule: {'ok' if ok else 'failed'}\n")
 
-    for g in sorted(games, key=lambda x: x["start"]):
-        print(f"  {g['start'].strftime('%Y-%m-%d %H:%M')}  {g['title']}")
+    for g in sorted(games, key=lambda x: x.start):
+        print(f"  {g.start.strftime('%Y-%m-%d %H:%M')}  {g.title}")
 
     if args.write_calendar:
         create_calendar(games)